@@ -23,8 +23,6 @@ You should aim for a solution with O(n + m) time and O(1) space, where n is the
 
 # LeetCode Problem Link: https://leetcode.com/problems/valid-anagram/
 
-from collections import Counter
-
 
 class Solution:
     def isAnagram(self, s: str, t: str) -> bool:
@@ -32,7 +30,16 @@ class Solution:
         Time Complexity: O(n + m) where n is length of s and m is length of t
         Space Complexity: O(1) since the character set is limited to lowercase English letters
         """
-        return Counter(s) == Counter(t)
+        if len(s) != len(t):
+            return False
+        # A flat 26-slot count array avoids the hashing and allocation of
+        # building two Counter dicts; the equal lengths let both strings be
+        # consumed in one fused pass
+        count = [0] * 26
+        for char_s, char_t in zip(s.encode(), t.encode()):
+            count[char_s - 97] += 1
+            count[char_t - 97] -= 1
+        return not any(count)
 
 
 if __name__ == "__main__":
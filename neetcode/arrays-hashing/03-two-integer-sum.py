@@ -45,16 +45,45 @@ class Solution:
         Space Complexity: O(n) in the worst case when all elements are unique
         """
         num_to_index = {}
+        # Bind the method once; a LOAD_FAST per iteration is cheaper than
+        # re-resolving the attribute on every probe
+        lookup = num_to_index.get
         for index, num in enumerate(nums):
-            complement = target - num
-            if complement in num_to_index:
-                return [num_to_index[complement], index]
+            # Single dict.get replaces the separate 'in' probe plus
+            # __getitem__ on a hit, so each element hashes the complement
+            # only once
+            complement_index = lookup(target - num)
+            if complement_index is not None:
+                return [complement_index, index]
             num_to_index[num] = index
         return []
 
+    def twoSumTwoPointer(self, nums: List[int], target: int) -> List[int]:
+        """
+        Alternative approach using sorting and two pointers.
+        Avoids hashing entirely: one sort plus a linear sweep over the
+        sorted order, which can win on cache behavior for small n.
+        Time Complexity: O(n log n) where n is the length of nums
+        Space Complexity: O(n) for the sorted index order
+        """
+        order = sorted(range(len(nums)), key=nums.__getitem__)
+        left, right = 0, len(nums) - 1
+        while left < right:
+            pair_sum = nums[order[left]] + nums[order[right]]
+            if pair_sum == target:
+                return sorted([order[left], order[right]])
+            if pair_sum < target:
+                left += 1
+            else:
+                right -= 1
+        return []
+
 
 if __name__ == "__main__":
     solution = Solution()
     print(solution.twoSum([3, 4, 5, 6], 7))  # Output: [0, 1]
     print(solution.twoSum([4, 5, 6], 10))  # Output: [0, 2]
     print(solution.twoSum([5, 5], 10))  # Output: [0, 1]
+    print(solution.twoSumTwoPointer([3, 4, 5, 6], 7))  # Output: [0, 1]
+    print(solution.twoSumTwoPointer([4, 5, 6], 10))  # Output: [0, 2]
+    print(solution.twoSumTwoPointer([5, 5], 10))  # Output: [0, 1]
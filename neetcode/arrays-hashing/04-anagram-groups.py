@@ -40,11 +40,21 @@ class Solution:
         Time Complexity: O(m * n) where m is the number of strings and n is the length of the longest string
         Space Complexity: O(m) for storing the grouped anagrams
         """
-        anagram_map = defaultdict(list)
+        # Map each signature to a small int group id; the dict holds only
+        # ints while the string lists live in one flat groups list
+        group_index = {}
+        groups = []
         for s in strs:
-            sorted_s = "".join(sorted(s))
-            anagram_map[sorted_s].append(s)
-        return list(anagram_map.values())
+            # A 26-byte count signature is cheaper to build than sorting the
+            # string, and bytes hash in a single C pass unlike a joined str
+            count = bytearray(26)
+            for char in s.encode():
+                count[char - 97] += 1
+            index = group_index.setdefault(bytes(count), len(groups))
+            if index == len(groups):
+                groups.append([])
+            groups[index].append(s)
+        return groups
 
     def groupAnagramsCount(self, strs: List[str]) -> List[List[str]]:
         """
@@ -54,10 +64,12 @@ class Solution:
         """
         anagram_map = defaultdict(list)
         for s in strs:
-            count = [0] * 26  # Since the problem states only lowercase English letters
-            for char in s:
-                count[ord(char) - ord("a")] += 1
-            anagram_map[tuple(count)].append(s)
+            count = bytearray(26)  # Since the problem states only lowercase English letters
+            for char in s.encode():
+                count[char - 97] += 1
+            # bytes(count) hashes as one 26-byte buffer, far cheaper than a
+            # 26-tuple of ints that hashes element by element
+            anagram_map[bytes(count)].append(s)
         return list(anagram_map.values())
 
 
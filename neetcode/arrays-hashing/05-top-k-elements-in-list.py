@@ -28,20 +28,35 @@ You should aim for a solution with O(n) time and O(n) space, where n is the size
 # LeetCode Problem Link: https://leetcode.com/problems/top-k-frequent-elements/
 
 
-from collections import Counter
+import heapq
+from collections import Counter, defaultdict
 from typing import List
 
 
 class Solution:
     def topKFrequent(self, nums: List[int], k: int) -> List[int]:
         """
-        Time Complexity: O(n) where n is the length of nums
+        Time Complexity: O(n log k) where n is the length of nums
         Space Complexity: O(n) for storing the frequency map
         """
-        frequency_map = Counter(nums)
-        # Sort the elements based on frequency and get the top k elements
-        most_common = frequency_map.most_common(k)
-        return [element for element, _ in most_common]
+        # A plain dict.get loop beats Counter's __missing__ dispatch
+        frequency_map = {}
+        for num in nums:
+            frequency_map[num] = frequency_map.get(num, 0) + 1
+
+        if k == 1:
+            # Single-pass max is cheaper than building a heap for k == 1
+            return [max(frequency_map, key=frequency_map.get)]
+
+        if k * 8 < len(frequency_map):
+            # Heap wins while k is much smaller than the number of
+            # distinct elements
+            return heapq.nlargest(k, frequency_map, key=frequency_map.get)
+
+        # For k close to the number of distinct elements a full Timsort
+        # pass has a lower constant factor than heap sifting
+        ordered = sorted(frequency_map, key=frequency_map.get, reverse=True)
+        return ordered[:k]
     
     def topKFrequentBucketSort(self, nums: List[int], k: int) -> List[int]:
         """
@@ -50,16 +65,17 @@ class Solution:
         Space Complexity: O(n) for storing the frequency map and buckets
         """
         frequency_map = Counter(nums)
-        max_freq = max(frequency_map.values())
-        
-        # Create buckets where index represents frequency
-        buckets = [[] for _ in range(max_freq + 1)]
+
+        # Only allocate buckets for frequencies that actually occur; a flat
+        # list of max_freq + 1 lists wastes allocations when a few elements
+        # dominate the counts
+        buckets = defaultdict(list)
         for num, freq in frequency_map.items():
             buckets[freq].append(num)
-        
+
         result = []
         # Collect top k frequent elements from the buckets
-        for freq in range(max_freq, 0, -1):
+        for freq in sorted(buckets, reverse=True):
             for num in buckets[freq]:
                 result.append(num)
                 if len(result) == k:
@@ -33,10 +33,13 @@ class Solution:
         """
         Encodes a list of strings to a single string.
 
+        The length prefix counts UTF-8 bytes rather than code points, so
+        decode can work on the encoded bytes directly.
+
         Time Complexity: O(m) where m is the total length of all strings in strs
         Space Complexity: O(m) for the encoded string
         """
-        return "".join(f"{len(s)}#{s}" for s in strs)
+        return "".join(f"{len(s.encode())}#{s}" for s in strs)
 
     def decode(self, s: str) -> List[str]:
         """
@@ -45,15 +48,54 @@ class Solution:
         Time Complexity: O(m) where m is the length of the encoded string s
         Space Complexity: O(n) where n is the number of decoded strings
         """
+        # Work on the UTF-8 bytes: the length prefixes count bytes, and
+        # indexing bytes yields ints so the digits parse inline without an
+        # int() call or a prefix substring per element
+        data = s.encode()
+        decoded_strs = []
+        i = 0
+        size = len(data)
+        while i < size:
+            length = 0
+            while data[i] != 35:  # ord("#")
+                length = length * 10 + data[i] - 48  # ord("0")
+                i += 1
+            i += 1
+            decoded_strs.append(data[i : i + length].decode())
+            i += length
+        return decoded_strs
+
+    def encodeBinary(self, strs: List[str]) -> bytes:
+        """
+        Alternative approach using a fixed 4-byte little-endian length prefix.
+
+        Time Complexity: O(m) where m is the total length of all strings in strs
+        Space Complexity: O(m) for the encoded bytes
+        """
+        parts = []
+        for s in strs:
+            encoded = s.encode()
+            parts.append(len(encoded).to_bytes(4, "little"))
+            parts.append(encoded)
+        return b"".join(parts)
+
+    def decodeBinary(self, data: bytes) -> List[str]:
+        """
+        Decodes bytes produced by encodeBinary back to a list of strings.
+
+        The fixed-width prefix needs no delimiter scan and no int() parse of
+        a digit substring, unlike the '#'-delimited format.
+
+        Time Complexity: O(m) where m is the length of the encoded bytes
+        Space Complexity: O(n) where n is the number of decoded strings
+        """
         decoded_strs = []
         i = 0
-        while i < len(s):
-            j = i
-            while s[j] != "#":
-                j += 1
-            length = int(s[i:j])
-            decoded_strs.append(s[j + 1 : j + 1 + length])
-            i = j + 1 + length
+        while i < len(data):
+            length = int.from_bytes(data[i : i + 4], "little")
+            i += 4
+            decoded_strs.append(data[i : i + length].decode())
+            i += length
         return decoded_strs
 
 
@@ -63,3 +105,7 @@ if __name__ == "__main__":
     print(f"Encoded: {encoded}")
     decoded = solution.decode(encoded)
     print(f"Decoded: {decoded}")
+    encoded_binary = solution.encodeBinary(["we", "say", ":", "yes"])
+    print(f"Encoded (binary): {encoded_binary}")
+    decoded_binary = solution.decodeBinary(encoded_binary)
+    print(f"Decoded (binary): {decoded_binary}")
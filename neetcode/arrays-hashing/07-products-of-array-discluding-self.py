@@ -27,6 +27,8 @@ You should aim for a solution as good or better than O(n) time and O(n) space, w
 # LeetCode Problem Link: https://leetcode.com/problems/product-of-array-except-self/
 
 
+from itertools import accumulate
+from operator import mul
 from typing import List
 
 
@@ -39,22 +41,36 @@ class Solution:
         n = len(nums)
         output = [1] * n
 
-        # Calculate left products
+        # Fused single pass: walk the prefix from the left and the suffix
+        # from the right at the same time; every index is touched once by
+        # each running product, halving the loop overhead of two passes
         left_product = 1
+        right_product = 1
         for i in range(n):
-            output[i] = left_product
+            output[i] *= left_product
+            output[n - 1 - i] *= right_product
             left_product *= nums[i]
-
-        # Calculate right products and multiply with left products
-        right_product = 1
-        for i in range(n - 1, -1, -1):
-            output[i] *= right_product
-            right_product *= nums[i]
+            right_product *= nums[n - 1 - i]
 
         return output
 
+    def productExceptSelfAccumulate(self, nums: List[int]) -> List[int]:
+        """
+        Alternative approach using itertools.accumulate.
+        Both running-product scans execute inside accumulate's C loop, so
+        no per-element multiply is dispatched from Python bytecode.
+        Time Complexity: O(n) where n is the length of nums
+        Space Complexity: O(n) for the prefix and suffix product lists
+        """
+        n = len(nums)
+        prefix = list(accumulate(nums[:-1], mul, initial=1))
+        suffix = list(accumulate(reversed(nums[1:]), mul, initial=1))
+        return [prefix[i] * suffix[n - 1 - i] for i in range(n)]
+
 
 if __name__ == "__main__":
     solution = Solution()
     print(solution.productExceptSelf([1, 2, 4, 6]))  # Output: [48, 24, 12, 8]
     print(solution.productExceptSelf([-1, 0, 1, 2, 3]))  # Output: [0, -6, 0, 0, 0]
+    print(solution.productExceptSelfAccumulate([1, 2, 4, 6]))  # Output: [48, 24, 12, 8]
+    print(solution.productExceptSelfAccumulate([-1, 0, 1, 2, 3]))  # Output: [0, -6, 0, 0, 0]
@@ -55,8 +55,33 @@ class Solution:
 
         return longest_streak
 
+    def longestConsecutiveSort(self, nums: List[int]) -> int:
+        """
+        Alternative approach using a sorted list of unique values.
+        Sequence probes become adjacent index reads on contiguous sorted
+        data instead of scattered set lookups.
+        Time Complexity: O(n log n) where n is the length of nums
+        Space Complexity: O(n) for the deduplicated sorted list
+        """
+        unique = sorted(set(nums))
+        if not unique:
+            return 0
+
+        # One flat pass over pairwise differences: a gap of 1 extends the
+        # current run, anything else restarts it — no nested walk loop
+        longest_streak = 1
+        current_streak = 1
+        for prev, curr in zip(unique, unique[1:]):
+            current_streak = current_streak + 1 if curr - prev == 1 else 1
+            if current_streak > longest_streak:
+                longest_streak = current_streak
+
+        return longest_streak
+
 
 if __name__ == "__main__":
     solution = Solution()
     print(solution.longestConsecutive([2, 20, 4, 10, 3, 4, 5]))  # Output: 4
     print(solution.longestConsecutive([0, 3, 2, 5, 4, 6, 1, 1]))  # Output: 7
+    print(solution.longestConsecutiveSort([2, 20, 4, 10, 3, 4, 5]))  # Output: 4
+    print(solution.longestConsecutiveSort([0, 3, 2, 5, 4, 6, 1, 1]))  # Output: 7